@@ -2,8 +2,16 @@
 KaliAgent - Ethical Hacking Assistant for Kali Linux
 """
 
-from .core.agent import KaliAgent
-from .config.settings import settings
-
 __version__ = "1.0.0"
 __all__ = ['KaliAgent', 'settings']
+
+
+def __getattr__(name):
+    """Lazily import heavy attributes so `import kaliagent` stays cheap"""
+    if name == 'KaliAgent':
+        from .core.agent import KaliAgent
+        return KaliAgent
+    if name == 'settings':
+        from .config.settings import settings
+        return settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1 @@
+# CLI command modules, loaded lazily by the LazyGroup in kaliagent.cli
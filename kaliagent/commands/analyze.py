@@ -0,0 +1,32 @@
+"""
+Analyze command for the KaliAI CLI
+"""
+
+import click
+from rich.console import Console
+import sys
+
+console = Console()
+
+@click.command('analyze')
+@click.argument('command', type=str)
+def cli(command):
+    """Analyze a Kali Linux command without executing it"""
+    from ..config.settings import settings
+    from ..core.agent import KaliAgent
+
+    try:
+        agent = KaliAgent()
+
+        # Force safe mode for analysis
+        settings.SAFE_MODE = True
+
+        # Generate prompt to analyze the command
+        prompt = f"Analyze this Kali Linux command: {command}"
+
+        # Process through the agent
+        agent.chat(prompt)
+
+    except Exception as e:
+        console.print(f"[red]Error: {str(e)}[/red]")
+        sys.exit(1)
@@ -0,0 +1,115 @@
+"""
+Configure command for the KaliAI CLI
+"""
+
+import click
+from rich.console import Console
+from ..config.config_manager import get_config_manager
+import os
+
+console = Console()
+config_manager = get_config_manager()
+
+# Known API-key prefixes mapped to their provider
+_PROVIDER_PREFIXES = (
+    ('AIza', 'gemini'),
+    ('sk-', 'openai'),
+)
+
+def _detect_provider(api_key):
+    """Detect the API provider from a key's prefix"""
+    for prefix, provider in _PROVIDER_PREFIXES:
+        if api_key.startswith(prefix):
+            return provider
+    return None
+
+@click.command('configure')
+@click.option('--api-key', help='API key (OpenAI or Google)')
+@click.option('--provider', type=click.Choice(['openai', 'gemini'], case_sensitive=False), help='API provider (openai or gemini)')
+@click.option('--safe-mode/--no-safe-mode', default=None, help='Enable/disable safe mode (no command execution)')
+@click.option('--confirm/--no-confirm', default=None, help='Require confirmation before executing commands')
+@click.option('--model', help='Model to use (e.g., gpt-3.5-turbo, gpt-4, gemini-2.0-flash-exp)')
+@click.option('--show', is_flag=True, help='Show current configuration')
+def cli(api_key, provider, safe_mode, confirm, model, show):
+    """Configure KaliAI settings"""
+    # Configure only needs the runtime view, not the full pydantic Settings
+    from ..config.settings import RuntimeSettings
+
+    if show:
+        from rich.console import Group
+        from rich.table import Table
+
+        # Build the whole view first, then render with a single console write
+        rt = RuntimeSettings.from_snapshot(config_manager.get_snapshot())
+        openai_key = rt.OPENAI_API_KEY
+        google_key = rt.GOOGLE_API_KEY
+
+        table = Table(show_header=False, box=None, pad_edge=False)
+        table.add_column(style="bold")
+        table.add_column()
+
+        if google_key:
+            masked_key = google_key[:10] + '...' + google_key[-4:] if len(google_key) > 14 else '***'
+            table.add_row("Provider:", "Google Gemini")
+            table.add_row("API Key:", masked_key)
+        elif openai_key:
+            masked_key = openai_key[:10] + '...' + openai_key[-4:] if len(openai_key) > 14 else '***'
+            table.add_row("Provider:", "OpenAI")
+            table.add_row("API Key:", masked_key)
+        else:
+            table.add_row("API Key:", "[red]Not configured[/red]")
+
+        table.add_row("Model:", str(rt.MODEL_ID))
+        table.add_row("Safe Mode:", "[green]Enabled[/green]" if rt.SAFE_MODE else "[red]Disabled[/red]")
+        table.add_row("Command Confirmation:", "[green]Required[/green]" if rt.REQUIRE_CONFIRMATION else "[yellow]Not Required[/yellow]")
+
+        console.print(Group(
+            "\n[bold cyan]Current Configuration:[/bold cyan]\n",
+            table,
+            f"\n[italic]Config file: {config_manager.config_file}[/italic]\n"
+        ))
+        return
+
+    # Update API key
+    if api_key:
+        # Auto-detect provider if not specified
+        if provider is None:
+            provider = _detect_provider(api_key)
+
+        if provider == 'gemini':
+            # Clear OpenAI key if switching to Gemini
+            config_manager.delete('OPENAI_API_KEY')
+            config_manager.set('GOOGLE_API_KEY', api_key)
+            os.environ['GOOGLE_API_KEY'] = api_key
+            console.print("[green]✓ Google Gemini API key configured successfully[/green]")
+        else:
+            # Clear Gemini key if switching to OpenAI
+            config_manager.delete('GOOGLE_API_KEY')
+            config_manager.set('OPENAI_API_KEY', api_key)
+            os.environ['OPENAI_API_KEY'] = api_key
+            console.print("[green]✓ OpenAI API key configured successfully[/green]")
+
+    # Update model
+    if model:
+        config_manager.set('MODEL_ID', model)
+        console.print(f"[green]✓ Model set to: {model}[/green]")
+
+    # Update settings
+    if safe_mode is not None:
+        config_manager.set('SAFE_MODE', safe_mode)
+        status = "Enabled" if safe_mode else "Disabled"
+        console.print(f"[green]✓ Safe mode: {status}[/green]")
+
+    if confirm is not None:
+        config_manager.set('REQUIRE_CONFIRMATION', confirm)
+        status = "Required" if confirm else "Not required"
+        console.print(f"[green]✓ Command confirmation: {status}[/green]")
+
+    # Persist all changes in a single write
+    config_manager.flush()
+
+    # If no options provided, show help
+    if not (api_key or safe_mode is not None or confirm is not None or model or provider):
+        console.print("[yellow]No configuration changes specified.[/yellow]")
+        console.print("[italic]Use 'kaliagent configure --show' to see current settings[/italic]")
+        console.print("[italic]Use 'kaliagent configure --help' for options[/italic]")
@@ -0,0 +1,86 @@
+"""
+Interactive command for the KaliAI CLI
+"""
+
+import click
+from rich.console import Console
+from ..config.config_manager import get_config_manager
+import os
+import sys
+
+console = Console()
+config_manager = get_config_manager()
+
+@click.command('interactive')
+def cli():
+    """Start interactive ethical hacking assistant"""
+    from ..config.settings import RuntimeSettings, settings
+    from ..core.agent import KaliAgent
+
+    try:
+        # Load API keys and settings from config or environment in one pass
+        snap = config_manager.get_snapshot()
+        api_key = snap.get('OPENAI_API_KEY')
+        google_key = snap.get('GOOGLE_API_KEY')
+
+        if not api_key and not google_key:
+            console.print("[red]Error: No API key found.[/red]")
+            console.print("[yellow]Use 'kaliagent configure --api-key YOUR_KEY --provider [openai|gemini]' to set it.[/yellow]")
+            sys.exit(1)
+
+        # Set environment variables for the session
+        if google_key:
+            os.environ['GOOGLE_API_KEY'] = google_key
+        if api_key:
+            os.environ['OPENAI_API_KEY'] = api_key
+
+        # Load other settings from the same snapshot. Environment-supplied
+        # values arrive as raw strings, so route them through RuntimeSettings
+        # for bool coercion — pydantic doesn't validate on assignment.
+        rt = RuntimeSettings.from_snapshot(snap)
+        if snap.get('MODEL_ID'):
+            settings.MODEL_ID = rt.MODEL_ID
+        if snap.get('SAFE_MODE') is not None:
+            settings.SAFE_MODE = rt.SAFE_MODE
+        if snap.get('REQUIRE_CONFIRMATION') is not None:
+            settings.REQUIRE_CONFIRMATION = rt.REQUIRE_CONFIRMATION
+
+        provider = "Google Gemini" if google_key else f"OpenAI ({settings.MODEL_ID})"
+        console.print("[bold blue]KaliAI - Ethical Hacking Assistant[/bold blue]")
+        console.print(f"[italic]Model: {provider} | Safe Mode: {'ON' if settings.SAFE_MODE else 'OFF'}[/italic]")
+        console.print("[italic]Type 'exit' to quit[/italic]\n")
+
+        agent = KaliAgent()
+
+        # prompt_toolkit reads input in buffered chunks, so multi-line pastes
+        # don't pay a read syscall per character like stock input() does
+        try:
+            from prompt_toolkit import PromptSession
+            prompt_line = PromptSession().prompt
+        except ImportError:
+            prompt_line = input
+
+        # Snapshot the flags once; the loop shouldn't re-read settings per turn
+        loop_safe_mode = settings.SAFE_MODE
+        loop_require_conf = settings.REQUIRE_CONFIRMATION
+
+        while True:
+            try:
+                user_input = prompt_line("🛡️ > ")
+                if user_input.lower() == 'exit':
+                    break
+
+                agent.chat(user_input, safe_mode=loop_safe_mode,
+                           require_conf=loop_require_conf)
+                print()
+
+            except (KeyboardInterrupt, EOFError):
+                break
+            except Exception as e:
+                console.print(f"[red]Error: {str(e)}[/red]")
+
+        console.print("\n[bold blue]Goodbye! Happy ethical hacking![/bold blue]")
+
+    except Exception as e:
+        console.print(f"[red]Fatal error: {str(e)}[/red]")
+        sys.exit(1)
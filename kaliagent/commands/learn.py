@@ -0,0 +1,44 @@
+"""
+Learn command for the KaliAI CLI
+"""
+
+import click
+from rich.console import Console
+from ..config.allowed_tools import ALLOWED_TOOLS
+import sys
+
+console = Console()
+
+class _ToolChoice(click.ParamType):
+    """Case-insensitive tool name validated via a frozenset in O(1)"""
+    name = 'tool'
+
+    _ALLOWED = frozenset(t.lower() for t in ALLOWED_TOOLS)
+
+    def convert(self, value, param, ctx):
+        tool = value.lower()
+        if tool in self._ALLOWED:
+            return tool
+        self.fail(
+            f"'{value}' is not one of: {', '.join(sorted(self._ALLOWED))}",
+            param, ctx
+        )
+
+@click.command('learn')
+@click.argument('tool', type=_ToolChoice())
+def cli(tool):
+    """Learn about a specific Kali Linux tool"""
+    from ..core.agent import KaliAgent
+
+    try:
+        agent = KaliAgent()
+
+        # Generate prompt to learn about the tool
+        prompt = f"Teach me about the {tool} tool in Kali Linux, including its purpose, basic usage, common flags, and security considerations."
+
+        # Process through the agent
+        agent.chat(prompt)
+
+    except Exception as e:
+        console.print(f"[red]Error: {str(e)}[/red]")
+        sys.exit(1)
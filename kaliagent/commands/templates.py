@@ -0,0 +1,156 @@
+"""
+Templates command group for the KaliAI CLI
+"""
+
+import click
+from rich.console import Console
+import sys
+
+console = Console()
+
+@click.group('templates')
+def cli():
+    """Manage command templates"""
+    pass
+
+@cli.command('list')
+@click.option('--category', '-c', help='Filter by category')
+def list_templates(category):
+    """List available command templates"""
+    from ..templates import TemplateManager
+
+    try:
+        manager = TemplateManager()
+
+        if category:
+            console.print(f"\n[bold]Templates in category: {category}[/bold]\n")
+        else:
+            console.print("\n[bold]All Available Templates[/bold]\n")
+            console.print("[italic]Use --category to filter by specific category[/italic]\n")
+
+        manager.display_templates(category)
+
+        console.print(f"\n[bold]Categories:[/bold] {', '.join(manager.get_categories())}")
+        console.print("\n[italic]Use 'kaliagent templates show <name>' for details[/italic]")
+
+    except Exception as e:
+        console.print(f"[red]Error: {str(e)}[/red]")
+        sys.exit(1)
+
+@cli.command('show')
+@click.argument('name', type=str)
+def show_template(name):
+    """Show detailed information about a template"""
+    from ..templates import TemplateManager
+
+    try:
+        manager = TemplateManager()
+        manager.display_template_details(name)
+
+    except Exception as e:
+        console.print(f"[red]Error: {str(e)}[/red]")
+        sys.exit(1)
+
+@cli.command('use')
+@click.argument('name', type=str)
+@click.option('--params', '-p', multiple=True, help='Parameters in format key=value')
+@click.option('--execute', '-e', is_flag=True, help='Execute the command (respects safe mode)')
+def use_template(name, params, execute):
+    """Use a command template"""
+    from ..templates import TemplateManager
+
+    try:
+        manager = TemplateManager()
+        template = manager.get_template(name)
+
+        if not template:
+            console.print(f"[red]Template '{name}' not found.[/red]")
+            console.print("[yellow]Use 'kaliagent templates list' to see available templates[/yellow]")
+            sys.exit(1)
+
+        # Show template details
+        manager.display_template_details(name)
+
+        # Parse parameters with a single scan per string
+        pairs = [p.partition('=') for p in params]
+        bad = [p for p, (_, sep, _) in zip(params, pairs) if not sep]
+        if bad:
+            for param in bad:
+                console.print(f"[red]Invalid parameter format: {param}[/red]")
+            console.print("[yellow]Use format: key=value[/yellow]")
+            sys.exit(1)
+        param_dict = {key: value for key, _, value in pairs}
+
+        # Check if all required parameters are provided
+        missing_params = set(template.parameters.keys()) - set(param_dict.keys())
+        if missing_params:
+            console.print(f"\n[yellow]Missing required parameters:[/yellow]")
+            for param in missing_params:
+                console.print(f"  • {param}: {template.parameters[param]}")
+            console.print(f"\n[italic]Example: kaliagent templates use {name} -p param1=value1 -p param2=value2[/italic]")
+            sys.exit(1)
+
+        # Generate command
+        command = manager.generate_command(name, param_dict)
+
+        console.print(f"\n[bold green]Generated Command:[/bold green]")
+        console.print(f"[cyan]{command}[/cyan]")
+
+        # Execute if requested. The command is already fully composed, so run
+        # it through the local executor instead of round-tripping it through
+        # the agent (and an LLM call that could rewrite it).
+        if execute:
+            from ..config.settings import settings
+            from ..utils.command_handler import execute_command
+
+            if settings.SAFE_MODE:
+                console.print("\n[yellow]Safe mode is enabled. Command will not be executed.[/yellow]")
+                return
+
+            if settings.REQUIRE_CONFIRMATION:
+                confirmation = console.input("\n[yellow]Execute this command? (y/n): [/yellow]").lower().strip()
+                if confirmation != 'y':
+                    console.print("[yellow]Command execution cancelled.[/yellow]")
+                    return
+
+            console.print(f"\n[yellow]Executing command...[/yellow]")
+            result = execute_command(command)
+
+            if result["success"]:
+                console.print("\n[green]Command executed successfully[/green]")
+                if result["stdout"]:
+                    console.print(result["stdout"])
+            else:
+                console.print(f"\n[red]Command failed: {result.get('error', 'see output below')}[/red]")
+                if result["stderr"]:
+                    console.print(result["stderr"])
+        else:
+            console.print(f"\n[yellow]Command not executed. Use --execute flag to run it.[/yellow]")
+
+    except Exception as e:
+        console.print(f"[red]Error: {str(e)}[/red]")
+        sys.exit(1)
+
+@cli.command('categories')
+def list_categories():
+    """List all template categories"""
+    from ..templates import TemplateManager
+
+    try:
+        from collections import Counter
+
+        manager = TemplateManager()
+        categories = manager.get_categories()
+
+        # Count all templates in a single pass instead of rescanning per category
+        counts = Counter(t.category for t in manager.list_templates())
+
+        console.print("\n[bold]Template Categories:[/bold]\n")
+        for cat in categories:
+            console.print(f"  • [cyan]{cat}[/cyan] ({counts[cat]} templates)")
+
+        console.print(f"\n[italic]Use 'kaliagent templates list --category <name>' to filter[/italic]")
+
+    except Exception as e:
+        console.print(f"[red]Error: {str(e)}[/red]")
+        sys.exit(1)
@@ -0,0 +1,11 @@
+"""
+Allowed security tools for KaliAI
+"""
+
+# Tools the agent is allowed to run. Lives in its own module so the CLI can
+# import it at decorator-evaluation time without pulling in pydantic settings.
+ALLOWED_TOOLS = [
+    "nmap", "nikto", "dirb", "gobuster", "wpscan", "sqlmap",
+    "wireshark", "metasploit", "hydra", "john", "hashcat",
+    "burpsuite", "aircrack-ng", "maltego", "beef", "zaproxy"
+]
@@ -2,13 +2,25 @@
 Configuration file management for KaliAI
 """
 
+import atexit
 import json
+import os
 from pathlib import Path
 from typing import Optional
 from rich.console import Console
 
+try:
+    import orjson
+except ImportError:  # fall back to stdlib json
+    orjson = None
+
 console = Console()
 
+# Keys that may also be supplied through the environment, mirroring what
+# the pydantic Settings would pick up from it
+_ENV_KEYS = ("OPENAI_API_KEY", "GOOGLE_API_KEY", "MODEL_ID",
+             "SAFE_MODE", "REQUIRE_CONFIRMATION")
+
 class ConfigManager:
     """Manage KaliAI configuration file"""
     
@@ -17,44 +29,83 @@ class ConfigManager:
             self.config_dir = Path.home() / ".kaliagent"
         else:
             self.config_dir = config_dir
-        
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+
+        if not self.config_dir.exists():
+            self.config_dir.mkdir(parents=True, exist_ok=True)
         self.config_file = self.config_dir / "config.json"
         self.config = self._load_config()
+        self._snapshot = None
+        self._dirty = False
+        # Changes are batched in memory and written once on exit (or via an
+        # explicit flush()) instead of rewriting the file per set()/delete()
+        atexit.register(self.flush)
     
     def _load_config(self) -> dict:
         """Load configuration from file"""
         if self.config_file.exists():
             try:
+                if orjson is not None:
+                    return orjson.loads(self.config_file.read_bytes())
                 with open(self.config_file, 'r', encoding='utf-8') as f:
                     return json.load(f)
             except Exception as e:
                 console.print(f"[yellow]Warning: Could not load config file: {str(e)}[/yellow]")
                 return {}
         return {}
-    
+
     def _save_config(self):
-        """Save configuration to file"""
+        """Save configuration to file atomically
+
+        Writes to a sibling tempfile and renames it over config.json, so a
+        crash mid-write can never leave a truncated file behind.
+        """
+        tmp = self.config_file.with_suffix('.json.tmp')
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2)
-        except Exception as e:
+            if orjson is not None:
+                tmp.write_bytes(orjson.dumps(self.config, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump(self.config, f, indent=2)
+            os.replace(tmp, self.config_file)
+        except OSError as e:
             console.print(f"[red]Error saving config: {str(e)}[/red]")
-    
+
+    def flush(self):
+        """Write the configuration to disk if it has unsaved changes"""
+        if self._dirty:
+            self._save_config()
+            self._dirty = False
+
     def set(self, key: str, value):
         """Set a configuration value"""
         self.config[key] = value
-        self._save_config()
-    
+        self._snapshot = None
+        self._dirty = True
+
     def get(self, key: str, default=None):
         """Get a configuration value"""
         return self.config.get(key, default)
-    
+
+    def get_snapshot(self) -> dict:
+        """Get a cached view of the config merged with the environment
+
+        File values take precedence over environment variables, matching the
+        `config_manager.get(key) or os.getenv(key)` lookup order. The same
+        dict is reused until the configuration changes, so callers can read
+        several keys without repeated env lookups.
+        """
+        if self._snapshot is None:
+            snapshot = {key: os.environ[key] for key in _ENV_KEYS if key in os.environ}
+            snapshot.update(self.config)
+            self._snapshot = snapshot
+        return self._snapshot
+
     def delete(self, key: str):
         """Delete a configuration value"""
         if key in self.config:
             del self.config[key]
-            self._save_config()
+            self._snapshot = None
+            self._dirty = True
     
     def get_all(self) -> dict:
         """Get all configuration"""
@@ -63,4 +114,16 @@ class ConfigManager:
     def clear(self):
         """Clear all configuration"""
         self.config = {}
-        self._save_config()
+        self._snapshot = None
+        self._dirty = True
+
+
+# Shared instance so the CLI and Settings don't each re-read config.json
+_INSTANCE: Optional[ConfigManager] = None
+
+def get_config_manager(config_dir: Optional[Path] = None) -> ConfigManager:
+    """Get the shared ConfigManager, creating it on first use"""
+    global _INSTANCE
+    if _INSTANCE is None:
+        _INSTANCE = ConfigManager(config_dir)
+    return _INSTANCE
@@ -1,8 +1,48 @@
 from pydantic_settings import BaseSettings
+from dataclasses import dataclass
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 import os
 
+from .allowed_tools import ALLOWED_TOOLS
+
+# Falsy spellings accepted for boolean environment values, as pydantic does
+_FALSY = frozenset({'', '0', 'false', 'no', 'off'})
+
+@dataclass(slots=True)
+class RuntimeSettings:
+    """Mutable runtime settings resolved from a config snapshot
+
+    Much cheaper to build than the pydantic Settings (no env/dotenv scan),
+    for CLI paths that only need these few values. Defaults mirror Settings.
+    """
+    OPENAI_API_KEY: Optional[str] = None
+    GOOGLE_API_KEY: Optional[str] = None
+    MODEL_ID: str = "gpt-3.5-turbo"
+    SAFE_MODE: bool = True
+    REQUIRE_CONFIRMATION: bool = True
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict) -> 'RuntimeSettings':
+        """Build runtime settings from a ConfigManager snapshot"""
+        rt = cls()
+        for name in ('OPENAI_API_KEY', 'GOOGLE_API_KEY', 'MODEL_ID',
+                     'SAFE_MODE', 'REQUIRE_CONFIRMATION'):
+            value = snapshot.get(name)
+            if value is None:
+                continue
+            if name in ('SAFE_MODE', 'REQUIRE_CONFIRMATION') and isinstance(value, str):
+                # Environment values arrive as strings; "false"/"0"/"no"
+                # must not read as truthy
+                value = value.strip().lower() not in _FALSY
+            setattr(rt, name, value)
+        return rt
+
+def ensure_dir(path: Path):
+    """Create a directory if missing, skipping the mkdir syscall when it exists"""
+    if not os.path.isdir(str(path)):
+        os.makedirs(str(path), exist_ok=True)
+
 class Settings(BaseSettings):
     """KaliAgent Configuration Settings"""
     
@@ -25,11 +65,7 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     
     # Security Settings
-    ALLOWED_TOOLS: List[str] = [
-        "nmap", "nikto", "dirb", "gobuster", "wpscan", "sqlmap", 
-        "wireshark", "metasploit", "hydra", "john", "hashcat",
-        "burpsuite", "aircrack-ng", "maltego", "beef", "zaproxy"
-    ]
+    ALLOWED_TOOLS: List[str] = ALLOWED_TOOLS
     
     # Command Execution
     SAFE_MODE: bool = True  # If True, will only display commands but not execute them
@@ -42,19 +78,18 @@ class Settings(BaseSettings):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         
-        # Create necessary directories
-        self.DATA_DIR.mkdir(parents=True, exist_ok=True)
-        self.LOG_DIR.mkdir(parents=True, exist_ok=True)
-        self.HISTORY_DIR.mkdir(parents=True, exist_ok=True)
-        
+        # Only the data dir is needed up front; LOG_DIR and HISTORY_DIR are
+        # created lazily on first write (see core.agent)
+        ensure_dir(self.DATA_DIR)
+
         # Load from config file if available
         self._load_from_config()
     
     def _load_from_config(self):
         """Load settings from config file"""
         try:
-            from .config_manager import ConfigManager
-            config_mgr = ConfigManager(self.DATA_DIR)
+            from .config_manager import get_config_manager
+            config_mgr = get_config_manager(self.DATA_DIR)
             
             # Update settings from config file
             api_key = config_mgr.get('OPENAI_API_KEY')
@@ -82,5 +117,14 @@ class Settings(BaseSettings):
             # If config loading fails, use defaults
             pass
 
-# Create global settings instance
-settings = Settings()
+# Global settings instance, created lazily on first access so that importing
+# this module stays cheap for commands that never touch Settings
+_settings = None
+
+def __getattr__(name):
+    if name == "settings":
+        global _settings
+        if _settings is None:
+            _settings = Settings()
+        return _settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,7 +2,7 @@ from typing import Dict, List, Optional, Any, Tuple
 from agno.agent import Agent
 from agno.models.openai import OpenAIChat
 from agno.models.google import Gemini
-from ..config.settings import settings
+from ..config.settings import settings, ensure_dir
 from rich.console import Console
 from rich.markdown import Markdown
 from datetime import datetime
@@ -57,6 +57,7 @@ class KaliAgent:
         # Only add handlers if they don't already exist
         if not self.logger.handlers:
             # File handler
+            ensure_dir(settings.LOG_DIR)
             fh = logging.FileHandler(settings.LOG_DIR / "kaliagent.log")
             fh.setLevel(settings.LOG_LEVEL)
             
@@ -126,17 +127,27 @@ class KaliAgent:
         4. Provide clear interpretation of results
         """
     
-    def chat(self, message: str):
-        """Process user input and generate responses"""
+    def chat(self, message: str, safe_mode: Optional[bool] = None,
+             require_conf: Optional[bool] = None):
+        """Process user input and generate responses
+
+        Callers in a loop can pass safe_mode/require_conf snapshots to avoid
+        re-reading settings on every turn.
+        """
+        if safe_mode is None:
+            safe_mode = settings.SAFE_MODE
+        if require_conf is None:
+            require_conf = settings.REQUIRE_CONFIRMATION
+
         try:
             self.logger.info(f"Processing user message: {message[:50]}...")
-            
+
             # Check if this is a command execution request
             is_command, command = self._is_command_request(message)
-            
+
             if is_command and command:
                 # Process as command execution request
-                self._handle_command_execution(command, message)
+                self._handle_command_execution(command, message, safe_mode, require_conf)
             else:
                 # Process as normal chat - use run() method instead of print_response()
                 console.print("[dim]Thinking...[/dim]")
@@ -196,7 +207,8 @@ class KaliAgent:
         
         return False, None
     
-    def _handle_command_execution(self, command: str, original_message: str):
+    def _handle_command_execution(self, command: str, original_message: str,
+                                  safe_mode: bool, require_conf: bool):
         """Handle execution of a Kali Linux command"""
         # First, validate if this is a security-related command
         is_security_command = self._validate_security_command(command)
@@ -211,7 +223,7 @@ class KaliAgent:
         self._get_command_explanation(command)
         
         # Ask for confirmation if required
-        if settings.REQUIRE_CONFIRMATION:
+        if require_conf:
             console.print("\n[yellow]Do you want to execute this command? (y/n)[/yellow]")
             confirmation = input("> ").lower().strip()
             if confirmation != 'y':
@@ -219,7 +231,7 @@ class KaliAgent:
                 return
         
         # Execute command if safe mode is disabled
-        if not settings.SAFE_MODE:
+        if not safe_mode:
             try:
                 console.print("\n[bold]Executing command...[/bold]")
                 
@@ -351,6 +363,7 @@ class KaliAgent:
             
             # Save to file with error handling
             try:
+                ensure_dir(settings.HISTORY_DIR)
                 history_file = settings.HISTORY_DIR / f"chat_{timestamp.replace(':', '-')}.json"
                 with open(history_file, 'w', encoding='utf-8') as f:
                     json.dump(interaction, f, indent=2)
@@ -376,6 +389,7 @@ class KaliAgent:
             
             # Save to file with error handling
             try:
+                ensure_dir(settings.HISTORY_DIR)
                 history_file = settings.HISTORY_DIR / f"command_{timestamp.replace(':', '-')}.json"
                 with open(history_file, 'w', encoding='utf-8') as f:
                     json.dump(interaction, f, indent=2)
@@ -4,17 +4,163 @@ Save, load, and replay command sequences
 """
 
 from typing import List, Dict, Optional
-from dataclasses import dataclass, field
-from datetime import datetime
+from dataclasses import dataclass, field, fields
 from pathlib import Path
+import gzip
+import hashlib
 import json
-from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
+import mmap
+import os
+import sys
+import time
+from rich.console import Console, Group
+
+try:
+    import orjson
+except ImportError:  # fall back to stdlib json
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional; listing falls back to full parsing
+    ijson = None
+
+try:
+    import msgpack
+except ImportError:  # optional; the index sidecar falls back to JSON
+    msgpack = None
 
 console = Console()
 
-@dataclass
+# Sidecar file holding the persisted search index for a playbook directory.
+# User-facing playbooks stay JSON; the internal index uses msgpack when
+# available since it encodes/decodes faster and smaller.
+_INDEX_FILENAME = '.playbook_index.msgpack' if msgpack is not None else '.playbook_index.json'
+
+# Files above this size are memory-mapped instead of read into a bytes copy
+_MMAP_THRESHOLD = 1 << 20
+
+# Canonical category names; keeping this space small and normalized stops
+# the search index fragmenting into near-duplicate buckets
+_CATEGORIES = frozenset({
+    'web-application',
+    'reconnaissance',
+    'exploitation',
+    'post-exploitation',
+    'wireless',
+    'database',
+})
+
+# [monotonic tick, isoformat string] — timestamps are memoized briefly so
+# bulk playbook replays don't allocate a fresh datetime per step
+_LAST_TS = [0.0, ""]
+
+def _now_iso() -> str:
+    """Current isoformat timestamp, refreshed at most every quarter second"""
+    from datetime import datetime
+    t = time.monotonic()
+    if t - _LAST_TS[0] > 0.25 or not _LAST_TS[1]:
+        _LAST_TS[:] = [t, datetime.now().isoformat()]
+    return _LAST_TS[1]
+
+def _load_json(filepath: Path) -> Dict:
+    """Parse a (possibly gzipped) JSON playbook file, using orjson when available"""
+    with open(filepath, 'rb') as f:
+        if (orjson is not None and not filepath.name.endswith('.gz')
+                and os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD):
+            # Let the OS page large files in on demand; orjson parses the
+            # mapping directly without an intermediate Python bytes copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return orjson.loads(memoryview(mm))
+        raw = f.read()
+    if raw[:2] == b'\x1f\x8b':  # gzip magic bytes
+        raw = gzip.decompress(raw)
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+def _playbook_filename(playbook: 'Playbook', compress: bool = False) -> str:
+    """Default on-disk filename for a playbook"""
+    suffix = '.json.gz' if compress else '.json'
+    return f"{playbook.name.replace(' ', '_').lower()}{suffix}"
+
+def _digest(data: Dict) -> bytes:
+    """Stable digest of a playbook dict (canonical sorted-key form)"""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(data, sort_keys=True).encode('utf-8')
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+def _needs_write(filepath: Path, data: Dict) -> bool:
+    """Check whether data differs from what's already on disk
+
+    The 'created' timestamp is ignored so regenerated defaults with a fresh
+    creation time don't count as changes.
+    """
+    try:
+        existing = _load_json(filepath)
+    except (OSError, ValueError):
+        return True
+    old = {k: v for k, v in existing.items() if k != 'created'}
+    new = {k: v for k, v in data.items() if k != 'created'}
+    return _digest(old) != _digest(new)
+
+def _scan_header(filepath: Path) -> Dict:
+    """Extract listing metadata without materializing every step
+
+    With ijson installed, streams just the top-level name/category events and
+    counts step objects, so large recorded outputs are never built as Python
+    objects. Falls back to a full parse otherwise.
+    """
+    if ijson is None:
+        data = _load_json(filepath)
+        return {
+            'name': data.get('name', 'Unknown'),
+            'category': data.get('category', 'N/A'),
+            'steps': len(data.get('steps', []))
+        }
+
+    meta = {'name': 'Unknown', 'category': 'N/A', 'steps': 0}
+    opener = gzip.open if filepath.name.endswith('.gz') else open
+    with opener(filepath, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == 'name' and event == 'string':
+                meta['name'] = value
+            elif prefix == 'category' and event == 'string':
+                meta['category'] = value
+            elif prefix == 'steps.item' and event == 'start_map':
+                meta['steps'] += 1
+    return meta
+
+def _load_index(filepath: Path) -> Dict:
+    """Read the index sidecar in whichever format it was written"""
+    if msgpack is not None:
+        return msgpack.unpackb(filepath.read_bytes(), raw=False)
+    return _load_json(filepath)
+
+def _dump_index(data: Dict, filepath: Path):
+    """Write the index sidecar, msgpack when available else JSON"""
+    if msgpack is not None:
+        filepath.write_bytes(msgpack.packb(data))
+    else:
+        _dump_json(data, filepath)
+
+def _dump_json(data: Dict, filepath: Path):
+    """Write indented JSON, gzipped when the target name ends in .gz"""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode('utf-8')
+
+    if filepath.name.endswith('.gz'):
+        # Level 1 keeps writes fast; JSON compresses well regardless
+        with gzip.open(filepath, 'wb', compresslevel=1) as f:
+            f.write(payload)
+    else:
+        filepath.write_bytes(payload)
+
+@dataclass(slots=True)
 class PlaybookStep:
     """Single step in a playbook"""
     command: str
@@ -25,7 +171,10 @@ class PlaybookStep:
     output: Optional[str] = None
     success: Optional[bool] = None
 
-@dataclass
+# Field names snapshotted once so to_dict doesn't rebuild them per step
+_STEP_FIELDS = tuple(f.name for f in fields(PlaybookStep))
+
+@dataclass(slots=True)
 class Playbook:
     """Collection of security testing steps"""
     name: str
@@ -54,15 +203,7 @@ class Playbook:
             "tags": self.tags,
             "notes": self.notes,
             "steps": [
-                {
-                    "command": step.command,
-                    "description": step.description,
-                    "expected_outcome": step.expected_outcome,
-                    "notes": step.notes,
-                    "timestamp": step.timestamp,
-                    "output": step.output,
-                    "success": step.success
-                }
+                {name: getattr(step, name) for name in _STEP_FIELDS}
                 for step in self.steps
             ]
         }
@@ -92,15 +233,33 @@ class PlaybookManager:
         self.playbook_dir = playbook_dir
         self.playbook_dir.mkdir(parents=True, exist_ok=True)
         self.current_playbook: Optional[Playbook] = None
+        # Listing metadata per file, keyed by path and invalidated by mtime,
+        # so repeated listings don't re-parse unchanged playbooks
+        self._meta_cache: Dict[Path, tuple] = {}
+        # Inverted search index (tag/category/target_type -> filenames),
+        # built lazily and persisted as a sidecar keyed by directory mtime
+        self._by_tag: Optional[Dict[str, set]] = None
+        self._by_category: Optional[Dict[str, set]] = None
+        self._by_target_type: Optional[Dict[str, set]] = None
+        self._index_mtime_ns: Optional[int] = None
     
     def create_playbook(self, name: str, description: str, author: str, 
                        category: str, target_type: str, tags: List[str] = None) -> Playbook:
         """Create a new playbook"""
+        # Store the normalized form so index buckets don't fragment on case
+        # or stray whitespace
+        category = category.strip().lower()
+        if category not in _CATEGORIES:
+            console.print(
+                f"[yellow]Unknown category '{category}' "
+                f"(known: {', '.join(sorted(_CATEGORIES))})[/yellow]"
+            )
+
         playbook = Playbook(
             name=name,
             description=description,
             author=author,
-            created=datetime.now().isoformat(),
+            created=_now_iso(),
             category=category,
             target_type=target_type,
             tags=tags or []
@@ -109,16 +268,18 @@ class PlaybookManager:
         console.print(f"[green]Created new playbook: {name}[/green]")
         return playbook
     
-    def save_playbook(self, playbook: Playbook, filename: Optional[str] = None):
-        """Save playbook to file"""
+    def save_playbook(self, playbook: Playbook, filename: Optional[str] = None,
+                      compress: bool = False):
+        """Save playbook to file, optionally gzipped (.json.gz)"""
         if filename is None:
-            filename = f"{playbook.name.replace(' ', '_').lower()}.json"
-        
+            filename = _playbook_filename(playbook, compress)
+
         filepath = self.playbook_dir / filename
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(playbook.to_dict(), f, indent=2)
+            _dump_json(playbook.to_dict(), filepath)
+            self._meta_cache.pop(filepath, None)
+            self._invalidate_index()
             console.print(f"[green]Playbook saved to: {filepath}[/green]")
         except Exception as e:
             console.print(f"[red]Error saving playbook: {str(e)}[/red]")
@@ -126,27 +287,142 @@ class PlaybookManager:
     def load_playbook(self, filename: str) -> Optional[Playbook]:
         """Load playbook from file"""
         filepath = self.playbook_dir / filename
-        
-        if not filepath.exists():
-            console.print(f"[red]Playbook file not found: {filepath}[/red]")
-            return None
-        
+
+        # EAFP: open directly rather than stat-then-open, saving a syscall
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
+            data = _load_json(filepath)
+
             playbook = Playbook.from_dict(data)
             self.current_playbook = playbook
             console.print(f"[green]Loaded playbook: {playbook.name}[/green]")
             return playbook
-            
+
+        except FileNotFoundError:
+            console.print(f"[red]Playbook file not found: {filepath}[/red]")
+            return None
         except Exception as e:
             console.print(f"[red]Error loading playbook: {str(e)}[/red]")
             return None
     
     def list_playbooks(self) -> List[Path]:
-        """List all available playbooks"""
-        return list(self.playbook_dir.glob('*.json'))
+        """List all available playbooks (plain and gzipped)"""
+        return sorted(
+            p for p in
+            list(self.playbook_dir.glob('*.json')) +
+            list(self.playbook_dir.glob('*.json.gz'))
+            if not p.name.startswith('.playbook_index')
+        )
+
+    def _invalidate_index(self):
+        """Drop the in-memory and on-disk search index"""
+        self._by_tag = None
+        self._by_category = None
+        self._by_target_type = None
+        self._index_mtime_ns = None
+        try:
+            (self.playbook_dir / _INDEX_FILENAME).unlink()
+        except OSError:
+            pass
+
+    def build_index(self, force: bool = False):
+        """Build the inverted tag/category/target-type index
+
+        Reuses the in-memory index (or the sidecar file) when the playbook
+        directory hasn't changed, so repeated searches are O(k) lookups
+        instead of full directory scans.
+        """
+        try:
+            dir_mtime = self.playbook_dir.stat().st_mtime_ns
+        except OSError:
+            dir_mtime = 0
+
+        if not force and self._by_tag is not None and self._index_mtime_ns == dir_mtime:
+            return
+
+        sidecar = self.playbook_dir / _INDEX_FILENAME
+        if not force:
+            try:
+                cached = _load_index(sidecar)
+                if cached.get('mtime_ns') == dir_mtime:
+                    self._by_tag = {k: set(v) for k, v in cached['by_tag'].items()}
+                    self._by_category = {k: set(v) for k, v in cached['by_category'].items()}
+                    self._by_target_type = {k: set(v) for k, v in cached['by_target_type'].items()}
+                    self._index_mtime_ns = dir_mtime
+                    return
+            except (OSError, ValueError, KeyError):
+                pass
+
+        by_tag: Dict[str, set] = {}
+        by_category: Dict[str, set] = {}
+        by_target_type: Dict[str, set] = {}
+
+        for filepath in self.list_playbooks():
+            try:
+                data = _load_json(filepath)
+            except Exception:
+                continue
+            name = filepath.name
+            for tag in data.get('tags', []):
+                by_tag.setdefault(tag, set()).add(name)
+            if data.get('category'):
+                by_category.setdefault(data['category'], set()).add(name)
+            if data.get('target_type'):
+                by_target_type.setdefault(data['target_type'], set()).add(name)
+
+        self._by_tag = by_tag
+        self._by_category = by_category
+        self._by_target_type = by_target_type
+        self._index_mtime_ns = dir_mtime
+
+        try:
+            _dump_index({
+                'mtime_ns': dir_mtime,
+                'by_tag': {k: sorted(v) for k, v in by_tag.items()},
+                'by_category': {k: sorted(v) for k, v in by_category.items()},
+                'by_target_type': {k: sorted(v) for k, v in by_target_type.items()}
+            }, sidecar)
+        except OSError:
+            pass
+
+    def find_playbooks(self, tags: Optional[List[str]] = None,
+                       category: Optional[str] = None,
+                       target_type: Optional[str] = None) -> List[str]:
+        """Find playbook filenames matching all of the given criteria"""
+        self.build_index()
+
+        result = None
+        if category is not None:
+            result = set(self._by_category.get(category, ()))
+        if target_type is not None:
+            bucket = self._by_target_type.get(target_type, set())
+            result = bucket.copy() if result is None else result & bucket
+        for tag in tags or ():
+            bucket = self._by_tag.get(tag, set())
+            result = bucket.copy() if result is None else result & bucket
+
+        if result is None:
+            result = {p.name for p in self.list_playbooks()}
+        return sorted(result)
+
+    def _playbook_meta(self, filepath: Path) -> Optional[Dict]:
+        """Get listing metadata for a playbook file, cached by mtime"""
+        try:
+            mtime_ns = filepath.stat().st_mtime_ns
+        except OSError:
+            self._meta_cache.pop(filepath, None)
+            return None
+
+        cached = self._meta_cache.get(filepath)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        try:
+            meta = _scan_header(filepath)
+        except Exception:
+            return None
+
+        self._meta_cache[filepath] = (mtime_ns, meta)
+        return meta
     
     def display_playbooks(self):
         """Display all available playbooks in a table"""
@@ -156,51 +432,71 @@ class PlaybookManager:
             console.print("[yellow]No playbooks found.[/yellow]")
             console.print(f"[italic]Playbooks are stored in: {self.playbook_dir}[/italic]")
             return
-        
+
+        from rich.table import Table
+
         table = Table(title="Available Playbooks")
         table.add_column("Filename", style="cyan", no_wrap=True)
         table.add_column("Name", style="magenta")
         table.add_column("Category", style="yellow")
         table.add_column("Steps", style="green")
         
-        for filepath in playbooks:
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                table.add_row(
-                    filepath.name,
-                    data.get('name', 'Unknown'),
-                    data.get('category', 'N/A'),
-                    str(len(data.get('steps', [])))
-                )
-            except Exception:
-                continue
-        
+        # Parsing is IO-bound, so overlap the per-file reads; cached entries
+        # return immediately from the mtime check either way
+        if len(playbooks) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(32, len(playbooks))) as ex:
+                metas = list(ex.map(self._playbook_meta, playbooks))
+        else:
+            metas = [self._playbook_meta(p) for p in playbooks]
+
+        # Plain Text cells skip Rich's per-cell markup parsing; the column
+        # styles above still colour them
+        from rich.text import Text
+
+        rows = [
+            (
+                Text(filepath.name),
+                Text(meta['name']),
+                Text(meta['category']),
+                Text(str(meta['steps']))
+            )
+            for filepath, meta in zip(playbooks, metas)
+            if meta is not None
+        ]
+        for row in rows:
+            table.add_row(*row)
+
         console.print(table)
     
     def display_playbook_details(self, playbook: Playbook):
         """Display detailed information about a playbook"""
-        console.print(f"\n[bold cyan]Playbook: {playbook.name}[/bold cyan]")
-        console.print(f"[bold]Description:[/bold] {playbook.description}")
-        console.print(f"[bold]Author:[/bold] {playbook.author}")
-        console.print(f"[bold]Created:[/bold] {playbook.created}")
-        console.print(f"[bold]Category:[/bold] {playbook.category}")
-        console.print(f"[bold]Target Type:[/bold] {playbook.target_type}")
-        
+        # Collect all lines first and render them with one console write
+        lines = [
+            f"\n[bold cyan]Playbook: {playbook.name}[/bold cyan]",
+            f"[bold]Description:[/bold] {playbook.description}",
+            f"[bold]Author:[/bold] {playbook.author}",
+            f"[bold]Created:[/bold] {playbook.created}",
+            f"[bold]Category:[/bold] {playbook.category}",
+            f"[bold]Target Type:[/bold] {playbook.target_type}"
+        ]
+
         if playbook.tags:
-            console.print(f"[bold]Tags:[/bold] {', '.join(playbook.tags)}")
-        
+            lines.append(f"[bold]Tags:[/bold] {', '.join(playbook.tags)}")
+
         if playbook.notes:
-            console.print(f"\n[bold]Notes:[/bold]\n{playbook.notes}")
-        
-        console.print(f"\n[bold]Steps ({len(playbook.steps)}):[/bold]")
+            lines.append(f"\n[bold]Notes:[/bold]\n{playbook.notes}")
+
+        lines.append(f"\n[bold]Steps ({len(playbook.steps)}):[/bold]")
         for i, step in enumerate(playbook.steps, 1):
-            console.print(f"\n[bold yellow]{i}. {step.description}[/bold yellow]")
-            console.print(f"   [cyan]Command:[/cyan] {step.command}")
-            console.print(f"   [green]Expected:[/green] {step.expected_outcome}")
+            lines.append(f"\n[bold yellow]{i}. {step.description}[/bold yellow]")
+            lines.append(f"   [cyan]Command:[/cyan] {step.command}")
+            lines.append(f"   [green]Expected:[/green] {step.expected_outcome}")
             if step.notes:
-                console.print(f"   [italic]Notes: {step.notes}[/italic]")
+                lines.append(f"   [italic]Notes: {step.notes}[/italic]")
+
+        console.print(Group(*lines))
     
     def add_step_to_current(self, command: str, description: str, 
                            expected_outcome: str, notes: str = ""):
@@ -219,25 +515,44 @@ class PlaybookManager:
         console.print(f"[green]Added step {len(self.current_playbook.steps)} to playbook[/green]")
         return True
     
-    def execute_playbook(self, playbook: Playbook, agent, start_step: int = 1, 
-                        interactive: bool = True):
-        """Execute a playbook"""
+    def execute_playbook(self, playbook: Playbook, agent, start_step: int = 1,
+                        interactive: bool = True,
+                        answers: Optional[List[str]] = None):
+        """Execute a playbook
+
+        answers, when given, is consumed in order in place of the
+        interactive prompts, so callers can queue choices up front. When
+        stdin is not a TTY and no answers are queued, prompting is
+        disabled automatically for batch runs.
+        """
+        queued = list(answers) if answers else None
+        if interactive and queued is None and not sys.stdin.isatty():
+            interactive = False
+
+        def _ask(prompt: str) -> str:
+            if queued:
+                return queued.pop(0).lower()
+            return console.input(prompt).lower()
+
         console.print(f"\n[bold]Executing Playbook: {playbook.name}[/bold]")
         console.print(f"[italic]{playbook.description}[/italic]\n")
-        
+
         if interactive:
             console.print("[yellow]Interactive mode: You'll be prompted before each step[/yellow]\n")
         
         for i, step in enumerate(playbook.steps[start_step-1:], start_step):
-            console.print(f"\n[bold cyan]Step {i}/{len(playbook.steps)}:[/bold cyan] {step.description}")
-            console.print(f"[bold]Command:[/bold] [green]{step.command}[/green]")
-            console.print(f"[bold]Expected Outcome:[/bold] {step.expected_outcome}")
-            
+            # One buffered write per step header instead of one per line
+            step_lines = [
+                f"\n[bold cyan]Step {i}/{len(playbook.steps)}:[/bold cyan] {step.description}",
+                f"[bold]Command:[/bold] [green]{step.command}[/green]",
+                f"[bold]Expected Outcome:[/bold] {step.expected_outcome}"
+            ]
             if step.notes:
-                console.print(f"[italic]Notes: {step.notes}[/italic]")
+                step_lines.append(f"[italic]Notes: {step.notes}[/italic]")
+            console.print(Group(*step_lines))
             
             if interactive:
-                choice = console.input("\n[yellow]Execute this step? (y/n/s=skip/q=quit): [/yellow]").lower()
+                choice = _ask("\n[yellow]Execute this step? (y/n/s=skip/q=quit): [/yellow]")
                 
                 if choice == 'q':
                     console.print("[yellow]Playbook execution cancelled.[/yellow]")
@@ -252,7 +567,7 @@ class PlaybookManager:
             # Execute the step
             try:
                 console.print("\n[bold]Executing...[/bold]")
-                step.timestamp = datetime.now().isoformat()
+                step.timestamp = _now_iso()
                 
                 # Use the agent to execute
                 agent.chat(f"Execute this command: {step.command}")
@@ -266,7 +581,7 @@ class PlaybookManager:
                 console.print(f"[red]✗ Step failed: {str(e)}[/red]")
                 
                 if interactive:
-                    cont = console.input("[yellow]Continue with next step? (y/n): [/yellow]").lower()
+                    cont = _ask("[yellow]Continue with next step? (y/n): [/yellow]")
                     if cont != 'y':
                         break
         
@@ -274,32 +589,35 @@ class PlaybookManager:
     
     def export_playbook_to_markdown(self, playbook: Playbook, filepath: Path):
         """Export playbook to markdown format"""
-        md_content = f"# {playbook.name}\n\n"
-        md_content += f"**Description:** {playbook.description}\n\n"
-        md_content += f"**Author:** {playbook.author}\n\n"
-        md_content += f"**Created:** {playbook.created}\n\n"
-        md_content += f"**Category:** {playbook.category}\n\n"
-        md_content += f"**Target Type:** {playbook.target_type}\n\n"
-        
+        # Collect fragments and join once — repeated str += is quadratic
+        parts = [
+            f"# {playbook.name}\n\n",
+            f"**Description:** {playbook.description}\n\n",
+            f"**Author:** {playbook.author}\n\n",
+            f"**Created:** {playbook.created}\n\n",
+            f"**Category:** {playbook.category}\n\n",
+            f"**Target Type:** {playbook.target_type}\n\n",
+        ]
+        append = parts.append
+
         if playbook.tags:
-            md_content += f"**Tags:** {', '.join(playbook.tags)}\n\n"
-        
+            append(f"**Tags:** {', '.join(playbook.tags)}\n\n")
+
         if playbook.notes:
-            md_content += f"## Notes\n\n{playbook.notes}\n\n"
-        
-        md_content += f"## Steps\n\n"
-        
+            append(f"## Notes\n\n{playbook.notes}\n\n")
+
+        append("## Steps\n\n")
+
         for i, step in enumerate(playbook.steps, 1):
-            md_content += f"### Step {i}: {step.description}\n\n"
-            md_content += f"**Command:**\n```bash\n{step.command}\n```\n\n"
-            md_content += f"**Expected Outcome:** {step.expected_outcome}\n\n"
-            
+            append(f"### Step {i}: {step.description}\n\n")
+            append(f"**Command:**\n```bash\n{step.command}\n```\n\n")
+            append(f"**Expected Outcome:** {step.expected_outcome}\n\n")
+
             if step.notes:
-                md_content += f"**Notes:** {step.notes}\n\n"
-        
+                append(f"**Notes:** {step.notes}\n\n")
+
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(md_content)
+            filepath.write_text("".join(parts), encoding='utf-8')
             console.print(f"[green]Playbook exported to: {filepath}[/green]")
         except Exception as e:
             console.print(f"[red]Error exporting playbook: {str(e)}[/red]")
@@ -346,8 +664,11 @@ def create_default_playbooks(manager: PlaybookManager):
         notes="Start with low risk/level, increase if needed"
     ))
     
-    manager.save_playbook(web_app_playbook)
-    
+    # Skip the write if the on-disk copy already matches
+    if _needs_write(manager.playbook_dir / _playbook_filename(web_app_playbook),
+                    web_app_playbook.to_dict()):
+        manager.save_playbook(web_app_playbook)
+
     # Network Reconnaissance Playbook
     network_recon_playbook = manager.create_playbook(
         name="Network Reconnaissance",
@@ -386,6 +707,8 @@ def create_default_playbooks(manager: PlaybookManager):
         notes="Requires root/admin privileges"
     ))
     
-    manager.save_playbook(network_recon_playbook)
-    
+    if _needs_write(manager.playbook_dir / _playbook_filename(network_recon_playbook),
+                    network_recon_playbook.to_dict()):
+        manager.save_playbook(network_recon_playbook)
+
     console.print("[green]Default playbooks created successfully![/green]")
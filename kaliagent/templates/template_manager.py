@@ -6,13 +6,32 @@ from typing import Dict, List, Optional
 from dataclasses import dataclass
 from pathlib import Path
 import json
+import re
+import sys
+
+try:
+    import orjson
+except ImportError:  # fall back to stdlib json
+    orjson = None
+
 from rich.console import Console
 from rich.table import Table
 from rich.markdown import Markdown
 
 console = Console()
 
-@dataclass
+# Splits a command string into literal chunks (even indices) and parameter
+# names (odd indices), e.g. "nmap -sV {target}" -> ['nmap -sV ', 'target', '']
+_PARAM_RE = re.compile(r'\{([a-zA-Z_][a-zA-Z0-9_]*)\}')
+
+_RISK_COLORS = {"low": "green", "medium": "yellow", "high": "red"}
+
+class _SafeDict(dict):
+    """Leaves unknown {placeholders} intact during format_map"""
+    def __missing__(self, key):
+        return '{' + key + '}'
+
+@dataclass(slots=True)
 class Template:
     """Command template structure"""
     name: str
@@ -24,266 +43,324 @@ class Template:
     notes: str
     risk_level: str  # low, medium, high
 
+# Built-in templates, constructed once at import and shared by every
+# TemplateManager instance; registration only links them into the indexes
+_DEFAULT_TEMPLATES = (
+
+    # Reconnaissance Templates
+    Template(
+        name="network-discovery",
+        category="reconnaissance",
+        description="Basic network discovery scan",
+        command="nmap -sn {network}",
+        parameters={"network": "Target network (e.g., 192.168.1.0/24)"},
+        examples=[
+            "nmap -sn 192.168.1.0/24",
+            "nmap -sn 10.0.0.0/24"
+        ],
+        notes="Quick host discovery without port scanning. Stealthy and fast.",
+        risk_level="low"
+    ),
+
+    Template(
+        name="port-scan-basic",
+        category="reconnaissance",
+        description="Standard port scan of common ports",
+        command="nmap -sS -T4 -p- {target}",
+        parameters={"target": "Target IP or hostname"},
+        examples=[
+            "nmap -sS -T4 -p- 192.168.1.10",
+            "nmap -sS -T4 -p- example.com"
+        ],
+        notes="SYN scan of all ports. May be detected by IDS.",
+        risk_level="medium"
+    ),
+
+    Template(
+        name="service-version-detection",
+        category="reconnaissance",
+        description="Detect service versions on open ports",
+        command="nmap -sV -p {ports} {target}",
+        parameters={
+            "ports": "Ports to scan (e.g., 80,443 or 1-1000)",
+            "target": "Target IP or hostname"
+        },
+        examples=[
+            "nmap -sV -p 80,443 192.168.1.10",
+            "nmap -sV -p 1-1000 example.com"
+        ],
+        notes="Active service fingerprinting. Useful for vulnerability assessment.",
+        risk_level="medium"
+    ),
+
+    Template(
+        name="os-detection",
+        category="reconnaissance",
+        description="Operating system detection",
+        command="nmap -O {target}",
+        parameters={"target": "Target IP or hostname"},
+        examples=[
+            "nmap -O 192.168.1.10",
+            "nmap -O example.com"
+        ],
+        notes="Requires root/admin privileges. May be noisy.",
+        risk_level="medium"
+    ),
+
+    # Web Application Templates
+    Template(
+        name="web-scan-basic",
+        category="web-application",
+        description="Basic web server vulnerability scan",
+        command="nikto -h {target}",
+        parameters={"target": "Target URL (e.g., http://example.com)"},
+        examples=[
+            "nikto -h http://example.com",
+            "nikto -h https://192.168.1.10"
+        ],
+        notes="Comprehensive but noisy. Generates many requests.",
+        risk_level="medium"
+    ),
+
+    Template(
+        name="web-scan-ssl",
+        category="web-application",
+        description="Web scan with SSL/TLS testing",
+        command="nikto -h {target} -ssl",
+        parameters={"target": "Target URL"},
+        examples=[
+            "nikto -h https://example.com -ssl"
+        ],
+        notes="Includes SSL/TLS vulnerability testing.",
+        risk_level="medium"
+    ),
+
+    Template(
+        name="directory-enumeration",
+        category="web-application",
+        description="Discover hidden directories and files",
+        command="dirb {target} {wordlist}",
+        parameters={
+            "target": "Target URL",
+            "wordlist": "Path to wordlist (optional, uses default if empty)"
+        },
+        examples=[
+            "dirb http://example.com",
+            "dirb http://example.com /usr/share/wordlists/dirb/common.txt"
+        ],
+        notes="Brute-force directory discovery. Can be time-consuming.",
+        risk_level="low"
+    ),
+
+    Template(
+        name="wordpress-scan",
+        category="web-application",
+        description="WordPress vulnerability scanner",
+        command="wpscan --url {target} --enumerate {options}",
+        parameters={
+            "target": "WordPress site URL",
+            "options": "Enumeration options (e.g., p,t,u for plugins,themes,users)"
+        },
+        examples=[
+            "wpscan --url http://example.com --enumerate p,t,u",
+            "wpscan --url http://example.com --enumerate vp"
+        ],
+        notes="Specialized for WordPress sites. Very thorough.",
+        risk_level="medium"
+    ),
+
+    # Database Testing Templates
+    Template(
+        name="sql-injection-test",
+        category="database",
+        description="Test for SQL injection vulnerabilities",
+        command="sqlmap -u {url} --batch",
+        parameters={"url": "Target URL with parameter (e.g., http://example.com/page?id=1)"},
+        examples=[
+            "sqlmap -u 'http://example.com/page.php?id=1' --batch",
+            "sqlmap -u 'http://example.com/login.php' --data='user=admin&pass=test' --batch"
+        ],
+        notes="Automated SQL injection testing. May modify database.",
+        risk_level="high"
+    ),
+
+    Template(
+        name="sql-injection-enumerate-dbs",
+        category="database",
+        description="Enumerate databases after SQL injection",
+        command="sqlmap -u {url} --dbs --batch",
+        parameters={"url": "Target URL with vulnerable parameter"},
+        examples=[
+            "sqlmap -u 'http://example.com/page.php?id=1' --dbs --batch"
+        ],
+        notes="Lists available databases. Only use if injection confirmed.",
+        risk_level="high"
+    ),
+
+    # Password Attacks Templates
+    Template(
+        name="ssh-bruteforce",
+        category="password-attack",
+        description="SSH password brute force attack",
+        command="hydra -l {username} -P {passwordlist} {target} ssh",
+        parameters={
+            "username": "Target username",
+            "passwordlist": "Path to password list",
+            "target": "Target IP or hostname"
+        },
+        examples=[
+            "hydra -l root -P /usr/share/wordlists/rockyou.txt 192.168.1.10 ssh",
+            "hydra -l admin -P passwords.txt example.com ssh"
+        ],
+        notes="Aggressive attack. May lock accounts or trigger alerts.",
+        risk_level="high"
+    ),
+
+    Template(
+        name="http-form-bruteforce",
+        category="password-attack",
+        description="HTTP form brute force attack",
+        command="hydra -l {username} -P {passwordlist} {target} http-post-form '{path}:{params}:{failure}'",
+        parameters={
+            "username": "Target username",
+            "passwordlist": "Path to password list",
+            "target": "Target domain",
+            "path": "Login page path",
+            "params": "POST parameters with ^USER^ and ^PASS^ placeholders",
+            "failure": "String in response indicating failed login"
+        },
+        examples=[
+            "hydra -l admin -P pass.txt example.com http-post-form '/login.php:user=^USER^&pass=^PASS^:Invalid'"
+        ],
+        notes="Complex syntax. Test carefully to avoid false positives.",
+        risk_level="high"
+    ),
+
+    # Wireless Templates
+    Template(
+        name="wifi-monitor-mode",
+        category="wireless",
+        description="Enable monitor mode on wireless interface",
+        command="airmon-ng start {interface}",
+        parameters={"interface": "Wireless interface (e.g., wlan0)"},
+        examples=[
+            "airmon-ng start wlan0",
+            "airmon-ng start wlan1"
+        ],
+        notes="Required before wireless attacks. May kill network processes.",
+        risk_level="low"
+    ),
+
+    Template(
+        name="wifi-scan",
+        category="wireless",
+        description="Scan for wireless networks",
+        command="airodump-ng {interface}",
+        parameters={"interface": "Monitor mode interface (e.g., wlan0mon)"},
+        examples=[
+            "airodump-ng wlan0mon"
+        ],
+        notes="Passive scanning. Press Ctrl+C to stop.",
+        risk_level="low"
+    ),
+
+    # Network Sniffing Templates
+    Template(
+        name="capture-traffic",
+        category="sniffing",
+        description="Capture network traffic to file",
+        command="wireshark -i {interface} -k -w {output}",
+        parameters={
+            "interface": "Network interface (e.g., eth0, wlan0)",
+            "output": "Output file path (.pcap)"
+        },
+        examples=[
+            "wireshark -i eth0 -k -w capture.pcap",
+            "wireshark -i wlan0 -k -w traffic.pcap"
+        ],
+        notes="Requires root/admin. Captures all traffic on interface.",
+        risk_level="low"
+    ),
+
+    # Exploitation Templates
+    Template(
+        name="metasploit-console",
+        category="exploitation",
+        description="Start Metasploit Framework console",
+        command="msfconsole",
+        parameters={},
+        examples=["msfconsole"],
+        notes="Interactive exploitation framework. Powerful and complex.",
+        risk_level="high"
+    ),
+)
+
 class TemplateManager:
     """Manage command templates"""
     
     def __init__(self):
         self.templates: Dict[str, Template] = {}
+        # Command strings parsed once at registration into
+        # (is_literal, text) segment tuples, keyed by template name
+        self._compiled_templates: Dict[str, tuple] = {}
+        # Rendered "[color]RISK[/color]" markup per template, built once at
+        # registration so table rows just read a cached string
+        self._risk_markup: Dict[str, str] = {}
+        # Templates bucketed by category, each bucket kept name-sorted, so
+        # category filters and displays skip full scans and re-sorts
+        self._by_category: Dict[str, List[Template]] = {}
+        # Rendered tables per category filter, valid for the version of the
+        # library they were built against; interactive menus re-display the
+        # same listing repeatedly between registrations
+        self._table_cache: Dict[Optional[str], Table] = {}
+        self._table_cache_version = 0
+        self._templates_version = 0
         self._load_default_templates()
     
     def _load_default_templates(self):
-        """Load built-in templates"""
-        
-        # Reconnaissance Templates
-        self.add_template(Template(
-            name="network-discovery",
-            category="reconnaissance",
-            description="Basic network discovery scan",
-            command="nmap -sn {network}",
-            parameters={"network": "Target network (e.g., 192.168.1.0/24)"},
-            examples=[
-                "nmap -sn 192.168.1.0/24",
-                "nmap -sn 10.0.0.0/24"
-            ],
-            notes="Quick host discovery without port scanning. Stealthy and fast.",
-            risk_level="low"
-        ))
-        
-        self.add_template(Template(
-            name="port-scan-basic",
-            category="reconnaissance",
-            description="Standard port scan of common ports",
-            command="nmap -sS -T4 -p- {target}",
-            parameters={"target": "Target IP or hostname"},
-            examples=[
-                "nmap -sS -T4 -p- 192.168.1.10",
-                "nmap -sS -T4 -p- example.com"
-            ],
-            notes="SYN scan of all ports. May be detected by IDS.",
-            risk_level="medium"
-        ))
-        
-        self.add_template(Template(
-            name="service-version-detection",
-            category="reconnaissance",
-            description="Detect service versions on open ports",
-            command="nmap -sV -p {ports} {target}",
-            parameters={
-                "ports": "Ports to scan (e.g., 80,443 or 1-1000)",
-                "target": "Target IP or hostname"
-            },
-            examples=[
-                "nmap -sV -p 80,443 192.168.1.10",
-                "nmap -sV -p 1-1000 example.com"
-            ],
-            notes="Active service fingerprinting. Useful for vulnerability assessment.",
-            risk_level="medium"
-        ))
-        
-        self.add_template(Template(
-            name="os-detection",
-            category="reconnaissance",
-            description="Operating system detection",
-            command="nmap -O {target}",
-            parameters={"target": "Target IP or hostname"},
-            examples=[
-                "nmap -O 192.168.1.10",
-                "nmap -O example.com"
-            ],
-            notes="Requires root/admin privileges. May be noisy.",
-            risk_level="medium"
-        ))
-        
-        # Web Application Templates
-        self.add_template(Template(
-            name="web-scan-basic",
-            category="web-application",
-            description="Basic web server vulnerability scan",
-            command="nikto -h {target}",
-            parameters={"target": "Target URL (e.g., http://example.com)"},
-            examples=[
-                "nikto -h http://example.com",
-                "nikto -h https://192.168.1.10"
-            ],
-            notes="Comprehensive but noisy. Generates many requests.",
-            risk_level="medium"
-        ))
-        
-        self.add_template(Template(
-            name="web-scan-ssl",
-            category="web-application",
-            description="Web scan with SSL/TLS testing",
-            command="nikto -h {target} -ssl",
-            parameters={"target": "Target URL"},
-            examples=[
-                "nikto -h https://example.com -ssl"
-            ],
-            notes="Includes SSL/TLS vulnerability testing.",
-            risk_level="medium"
-        ))
-        
-        self.add_template(Template(
-            name="directory-enumeration",
-            category="web-application",
-            description="Discover hidden directories and files",
-            command="dirb {target} {wordlist}",
-            parameters={
-                "target": "Target URL",
-                "wordlist": "Path to wordlist (optional, uses default if empty)"
-            },
-            examples=[
-                "dirb http://example.com",
-                "dirb http://example.com /usr/share/wordlists/dirb/common.txt"
-            ],
-            notes="Brute-force directory discovery. Can be time-consuming.",
-            risk_level="low"
-        ))
-        
-        self.add_template(Template(
-            name="wordpress-scan",
-            category="web-application",
-            description="WordPress vulnerability scanner",
-            command="wpscan --url {target} --enumerate {options}",
-            parameters={
-                "target": "WordPress site URL",
-                "options": "Enumeration options (e.g., p,t,u for plugins,themes,users)"
-            },
-            examples=[
-                "wpscan --url http://example.com --enumerate p,t,u",
-                "wpscan --url http://example.com --enumerate vp"
-            ],
-            notes="Specialized for WordPress sites. Very thorough.",
-            risk_level="medium"
-        ))
-        
-        # Database Testing Templates
-        self.add_template(Template(
-            name="sql-injection-test",
-            category="database",
-            description="Test for SQL injection vulnerabilities",
-            command="sqlmap -u {url} --batch",
-            parameters={"url": "Target URL with parameter (e.g., http://example.com/page?id=1)"},
-            examples=[
-                "sqlmap -u 'http://example.com/page.php?id=1' --batch",
-                "sqlmap -u 'http://example.com/login.php' --data='user=admin&pass=test' --batch"
-            ],
-            notes="Automated SQL injection testing. May modify database.",
-            risk_level="high"
-        ))
-        
-        self.add_template(Template(
-            name="sql-injection-enumerate-dbs",
-            category="database",
-            description="Enumerate databases after SQL injection",
-            command="sqlmap -u {url} --dbs --batch",
-            parameters={"url": "Target URL with vulnerable parameter"},
-            examples=[
-                "sqlmap -u 'http://example.com/page.php?id=1' --dbs --batch"
-            ],
-            notes="Lists available databases. Only use if injection confirmed.",
-            risk_level="high"
-        ))
-        
-        # Password Attacks Templates
-        self.add_template(Template(
-            name="ssh-bruteforce",
-            category="password-attack",
-            description="SSH password brute force attack",
-            command="hydra -l {username} -P {passwordlist} {target} ssh",
-            parameters={
-                "username": "Target username",
-                "passwordlist": "Path to password list",
-                "target": "Target IP or hostname"
-            },
-            examples=[
-                "hydra -l root -P /usr/share/wordlists/rockyou.txt 192.168.1.10 ssh",
-                "hydra -l admin -P passwords.txt example.com ssh"
-            ],
-            notes="Aggressive attack. May lock accounts or trigger alerts.",
-            risk_level="high"
-        ))
-        
-        self.add_template(Template(
-            name="http-form-bruteforce",
-            category="password-attack",
-            description="HTTP form brute force attack",
-            command="hydra -l {username} -P {passwordlist} {target} http-post-form '{path}:{params}:{failure}'",
-            parameters={
-                "username": "Target username",
-                "passwordlist": "Path to password list",
-                "target": "Target domain",
-                "path": "Login page path",
-                "params": "POST parameters with ^USER^ and ^PASS^ placeholders",
-                "failure": "String in response indicating failed login"
-            },
-            examples=[
-                "hydra -l admin -P pass.txt example.com http-post-form '/login.php:user=^USER^&pass=^PASS^:Invalid'"
-            ],
-            notes="Complex syntax. Test carefully to avoid false positives.",
-            risk_level="high"
-        ))
-        
-        # Wireless Templates
-        self.add_template(Template(
-            name="wifi-monitor-mode",
-            category="wireless",
-            description="Enable monitor mode on wireless interface",
-            command="airmon-ng start {interface}",
-            parameters={"interface": "Wireless interface (e.g., wlan0)"},
-            examples=[
-                "airmon-ng start wlan0",
-                "airmon-ng start wlan1"
-            ],
-            notes="Required before wireless attacks. May kill network processes.",
-            risk_level="low"
-        ))
-        
-        self.add_template(Template(
-            name="wifi-scan",
-            category="wireless",
-            description="Scan for wireless networks",
-            command="airodump-ng {interface}",
-            parameters={"interface": "Monitor mode interface (e.g., wlan0mon)"},
-            examples=[
-                "airodump-ng wlan0mon"
-            ],
-            notes="Passive scanning. Press Ctrl+C to stop.",
-            risk_level="low"
-        ))
-        
-        # Network Sniffing Templates
-        self.add_template(Template(
-            name="capture-traffic",
-            category="sniffing",
-            description="Capture network traffic to file",
-            command="wireshark -i {interface} -k -w {output}",
-            parameters={
-                "interface": "Network interface (e.g., eth0, wlan0)",
-                "output": "Output file path (.pcap)"
-            },
-            examples=[
-                "wireshark -i eth0 -k -w capture.pcap",
-                "wireshark -i wlan0 -k -w traffic.pcap"
-            ],
-            notes="Requires root/admin. Captures all traffic on interface.",
-            risk_level="low"
-        ))
-        
-        # Exploitation Templates
-        self.add_template(Template(
-            name="metasploit-console",
-            category="exploitation",
-            description="Start Metasploit Framework console",
-            command="msfconsole",
-            parameters={},
-            examples=["msfconsole"],
-            notes="Interactive exploitation framework. Powerful and complex.",
-            risk_level="high"
-        ))
-    
+        """Register the shared built-in templates"""
+        for template in _DEFAULT_TEMPLATES:
+            self.add_template(template)
+
     def add_template(self, template: Template):
         """Add a template to the library"""
+        # Interned once here, category and risk strings compare by pointer
+        # in the dict/set paths that key on them
+        template.category = sys.intern(template.category)
+        template.risk_level = sys.intern(template.risk_level)
+        # If this name is already registered under another category, pull the
+        # old object out of that bucket so it can't linger in listings
+        old = self.templates.get(template.name)
+        if old is not None and old.category != template.category:
+            old_bucket = self._by_category.get(old.category)
+            if old_bucket is not None:
+                old_bucket[:] = [t for t in old_bucket if t.name != template.name]
+                if not old_bucket:
+                    del self._by_category[old.category]
         self.templates[template.name] = template
+        # Parse the command once here so generate_command is a single join
+        # with dict lookups instead of repeated replace scans per call
+        pieces = _PARAM_RE.split(template.command)
+        segments = tuple(
+            (i % 2 == 0, piece)
+            for i, piece in enumerate(pieces)
+            if piece or i % 2
+        )
+        # format_map is only faithful when every brace forms a simple
+        # {name} placeholder; stray/structured braces ({a.b}, {arr[0]},
+        # lone {) must take the segment join, which treats them as literals
+        fm_safe = not any(
+            is_literal and ('{' in text or '}' in text)
+            for is_literal, text in segments
+        )
+        self._compiled_templates[template.name] = (segments, fm_safe)
+        color = _RISK_COLORS.get(template.risk_level, "white")
+        self._risk_markup[template.name] = f"[{color}]{template.risk_level.upper()}[/{color}]"
+        bucket = self._by_category.setdefault(template.category, [])
+        bucket[:] = [t for t in bucket if t.name != template.name]
+        bucket.append(template)
+        bucket.sort(key=lambda t: t.name)
+        self._templates_version += 1
     
     def get_template(self, name: str) -> Optional[Template]:
         """Get a template by name"""
@@ -292,17 +369,32 @@ class TemplateManager:
     def list_templates(self, category: Optional[str] = None) -> List[Template]:
         """List all templates, optionally filtered by category"""
         if category:
-            return [t for t in self.templates.values() if t.category == category]
+            return list(self._by_category.get(category, []))
         return list(self.templates.values())
-    
+
     def get_categories(self) -> List[str]:
         """Get all unique categories"""
-        return sorted(list(set(t.category for t in self.templates.values())))
+        return sorted(self._by_category)
     
     def display_templates(self, category: Optional[str] = None):
         """Display templates in a nice table"""
-        templates = self.list_templates(category)
-        
+        if self._table_cache_version != self._templates_version:
+            self._table_cache.clear()
+            self._table_cache_version = self._templates_version
+
+        cached = self._table_cache.get(category)
+        if cached is not None:
+            console.print(cached)
+            return
+
+        # Buckets are already name-sorted, so walking categories in order
+        # yields (category, name) order without a per-render sort
+        if category:
+            templates = self._by_category.get(category, [])
+        else:
+            templates = [t for c in sorted(self._by_category)
+                         for t in self._by_category[c]]
+
         if not templates:
             console.print("[yellow]No templates found.[/yellow]")
             return
@@ -313,20 +405,15 @@ class TemplateManager:
         table.add_column("Description", style="white")
         table.add_column("Risk", style="yellow")
         
-        for template in sorted(templates, key=lambda t: (t.category, t.name)):
-            risk_color = {
-                "low": "green",
-                "medium": "yellow",
-                "high": "red"
-            }.get(template.risk_level, "white")
-            
+        for template in templates:
             table.add_row(
                 template.name,
                 template.category,
                 template.description,
-                f"[{risk_color}]{template.risk_level.upper()}[/{risk_color}]"
+                self._risk_markup[template.name]
             )
-        
+
+        self._table_cache[category] = table
         console.print(table)
     
     def display_template_details(self, name: str):
@@ -337,15 +424,9 @@ class TemplateManager:
             console.print(f"[red]Template '{name}' not found.[/red]")
             return
         
-        risk_color = {
-            "low": "green",
-            "medium": "yellow",
-            "high": "red"
-        }.get(template.risk_level, "white")
-        
         console.print(f"\n[bold cyan]Template: {template.name}[/bold cyan]")
         console.print(f"[bold]Category:[/bold] {template.category}")
-        console.print(f"[bold]Risk Level:[/bold] [{risk_color}]{template.risk_level.upper()}[/{risk_color}]")
+        console.print(f"[bold]Risk Level:[/bold] {self._risk_markup[template.name]}")
         console.print(f"\n[bold]Description:[/bold]\n{template.description}")
         
         console.print(f"\n[bold]Command Template:[/bold]")
@@ -367,16 +448,23 @@ class TemplateManager:
     
     def generate_command(self, name: str, params: Dict[str, str]) -> Optional[str]:
         """Generate a command from a template with given parameters"""
-        template = self.get_template(name)
-        
-        if not template:
+        compiled = self._compiled_templates.get(name)
+
+        if compiled is None:
             return None
-        
-        command = template.command
-        for param, value in params.items():
-            command = command.replace(f"{{{param}}}", value)
-        
-        return command
+
+        segments, fm_safe = compiled
+        if fm_safe:
+            # Single C-level scan; unprovided parameters keep their
+            # {placeholder} form
+            return self.templates[name].command.format_map(_SafeDict(params))
+
+        # Commands with stray or structured braces take the segment join,
+        # which renders them as literal text like the old replace loop did
+        return "".join(
+            text if is_literal else params.get(text, '{' + text + '}')
+            for is_literal, text in segments
+        )
     
     def save_custom_template(self, template: Template, filepath: Path):
         """Save a custom template to a file"""
@@ -391,17 +479,23 @@ class TemplateManager:
             "risk_level": template.risk_level
         }
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(template_dict, f, indent=2)
-        
+        if orjson is not None:
+            payload = orjson.dumps(template_dict, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(template_dict, indent=2).encode('utf-8')
+
+        with open(filepath, 'wb') as f:
+            f.write(payload)
+
         console.print(f"[green]Template saved to {filepath}[/green]")
     
     def load_custom_template(self, filepath: Path) -> Optional[Template]:
         """Load a custom template from a file"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw.decode('utf-8'))
+
             template = Template(**data)
             self.add_template(template)
             console.print(f"[green]Template '{template.name}' loaded successfully[/green]")
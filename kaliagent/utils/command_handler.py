@@ -1,55 +1,135 @@
+import collections
+import functools
+import os
+import select
 import subprocess
 import shlex
 import shutil
+import sys
+import time
 from typing import Dict, Tuple, List, Optional
 from pathlib import Path
 import logging
+from ..config.allowed_tools import ALLOWED_TOOLS
 from ..config.settings import settings
 
 logger = logging.getLogger("kaliagent.commands")
 
-def check_tool_installed(tool_name: str) -> bool:
-    """Check if a security tool is installed on the system
-    
-    Uses shutil.which() for cross-platform compatibility (Windows/Linux/Mac)
+# Interned frozenset for O(1) membership checks against shlex-split tokens
+_ALLOWED = frozenset(sys.intern(tool) for tool in ALLOWED_TOOLS)
+
+# Output retention per stream: up to _TAIL_CHUNKS chunks of _READ_SIZE bytes
+_TAIL_CHUNKS = 4096
+_READ_SIZE = 8192
+
+# select() only handles sockets on Windows, so the streaming drain is
+# POSIX-only and Windows buffers via communicate() as before
+_IS_WINDOWS = sys.platform.startswith('win')
+
+def _drain_process(proc: subprocess.Popen, timeout: int) -> Tuple[str, str]:
+    """Read a child's stdout/stderr incrementally with bounded retention
+
+    Only the most recent chunks of each stream are kept, so peak memory is
+    O(tail window) instead of O(full output) for chatty tools like nmap
+    full-port scans or nikto. On Windows the incremental path isn't
+    available and the output is buffered whole.
+    """
+    if _IS_WINDOWS:
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
+        return (stdout.decode('utf-8', errors='replace'),
+                stderr.decode('utf-8', errors='replace'))
+
+    tails = {}
+    open_fds = set()
+    for stream in (proc.stdout, proc.stderr):
+        fd = stream.fileno()
+        os.set_blocking(fd, False)
+        tails[fd] = collections.deque(maxlen=_TAIL_CHUNKS)
+        open_fds.add(fd)
+
+    deadline = time.monotonic() + timeout
+    while open_fds:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            proc.kill()
+            proc.wait()
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+        ready, _, _ = select.select(open_fds, (), (), min(remaining, 1.0))
+        for fd in ready:
+            chunk = os.read(fd, _READ_SIZE)
+            if chunk:
+                tails[fd].append(chunk)
+            else:
+                open_fds.discard(fd)
+
+    try:
+        proc.wait(timeout=max(deadline - time.monotonic(), 0.1))
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+
+    stdout = b"".join(tails[proc.stdout.fileno()]).decode('utf-8', errors='replace')
+    stderr = b"".join(tails[proc.stderr.fileno()]).decode('utf-8', errors='replace')
+    return stdout, stderr
+
+@functools.lru_cache(maxsize=256)
+def _tool_path(tool_name: str) -> Optional[str]:
+    """Absolute path of a tool, or None if not on PATH
+
+    Uses shutil.which() for cross-platform compatibility (Windows/Linux/Mac).
+    Results are memoized for the session since PATH rarely changes; call
+    _tool_path.cache_clear() to re-probe.
     """
     try:
         # shutil.which() is cross-platform and returns None if not found
-        return shutil.which(tool_name) is not None
+        return shutil.which(tool_name)
     except Exception as e:
         logger.error(f"Error checking tool installation: {str(e)}")
-        return False
+        return None
+
+def check_tool_installed(tool_name: str) -> bool:
+    """Check if a security tool is installed on the system"""
+    return _tool_path(tool_name) is not None
 
-def validate_command(command: str) -> Tuple[bool, str]:
+def validate_command(command: str) -> Tuple[bool, str, Optional[List[str]]]:
     """Validate if a command is safe to execute
-    
+
     Returns:
-        Tuple[bool, str]: (is_valid, reason)
+        Tuple[bool, str, Optional[List[str]]]: (is_valid, reason, parsed args)
+
+    The parsed args are returned on success so callers don't have to run
+    shlex over the same string a second time.
     """
     if not command or not command.strip():
-        return False, "Empty command"
-    
+        return False, "Empty command", None
+
     # Parse command to get the base command
     try:
         args = shlex.split(command)
         if not args:
-            return False, "Unable to parse command"
-            
+            return False, "Unable to parse command", None
+
         base_cmd = args[0]
-        
+
         # Check if in allowed tools list
-        if base_cmd not in settings.ALLOWED_TOOLS:
-            return False, f"Tool '{base_cmd}' is not in the allowed tools list"
-            
+        if base_cmd not in _ALLOWED:
+            return False, f"Tool '{base_cmd}' is not in the allowed tools list", None
+
         # Check if tool is installed
         if not check_tool_installed(base_cmd):
-            return False, f"Tool '{base_cmd}' is not installed on this system"
-            
-        return True, "Command is valid"
-        
+            return False, f"Tool '{base_cmd}' is not installed on this system", None
+
+        return True, "Command is valid", args
+
     except Exception as e:
         logger.error(f"Error validating command: {str(e)}")
-        return False, f"Error validating command: {str(e)}"
+        return False, f"Error validating command: {str(e)}", None
 
 def execute_command(command: str) -> Dict:
     """Execute a security-related command safely
@@ -57,9 +137,9 @@ def execute_command(command: str) -> Dict:
     Returns:
         Dict containing execution results
     """
-    # First validate the command
-    is_valid, reason = validate_command(command)
-    
+    # First validate the command; reuse the args it already parsed
+    is_valid, reason, cmd_args = validate_command(command)
+
     if not is_valid:
         return {
             "success": False,
@@ -68,33 +148,27 @@ def execute_command(command: str) -> Dict:
             "stderr": "",
             "returncode": -1
         }
-    
+
     try:
-        # Parse command securely
-        try:
-            cmd_args = shlex.split(command)
-        except ValueError as e:
-            return {
-                "success": False,
-                "error": f"Invalid command syntax: {str(e)}",
-                "stdout": "",
-                "stderr": "",
-                "returncode": -1
-            }
-        
-        # Execute the command with shell=False for security
-        process = subprocess.run(
+        # Substitute the cached absolute path so execvp doesn't walk PATH again
+        resolved = _tool_path(cmd_args[0])
+        if resolved:
+            cmd_args[0] = resolved
+
+        # Execute the command with shell=False for security, draining output
+        # as it arrives instead of buffering it whole in the pipe
+        process = subprocess.Popen(
             cmd_args,
             shell=False,  # Security: Never use shell=True with user input
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
         )
-        
+        stdout, stderr = _drain_process(process, timeout=300)  # 5 minute timeout
+
         return {
             "success": process.returncode == 0,
-            "stdout": process.stdout,
-            "stderr": process.stderr,
+            "stdout": stdout,
+            "stderr": stderr,
             "returncode": process.returncode,
             "command": command
         }
@@ -128,12 +202,25 @@ def execute_command(command: str) -> Dict:
             "command": command
         }
 
-def get_installed_security_tools() -> List[str]:
+# Full enumeration result, cached until an explicit refresh
+_installed_cache: Optional[List[str]] = None
+
+def get_installed_security_tools(refresh: bool = False) -> List[str]:
     """Get a list of security tools that are installed on the system"""
-    installed_tools = []
-    
-    for tool in settings.ALLOWED_TOOLS:
-        if check_tool_installed(tool):
-            installed_tools.append(tool)
-            
-    return installed_tools
+    global _installed_cache
+
+    if refresh:
+        _tool_path.cache_clear()
+        _installed_cache = None
+
+    if _installed_cache is None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        # The which() lookups are stat-bound and release the GIL, so a cold
+        # enumeration of the whole tool list parallelizes well
+        tools = list(settings.ALLOWED_TOOLS)
+        with ThreadPoolExecutor(max_workers=min(16, len(tools))) as ex:
+            flags = ex.map(check_tool_installed, tools)
+        _installed_cache = [tool for tool, ok in zip(tools, flags) if ok]
+
+    return list(_installed_cache)
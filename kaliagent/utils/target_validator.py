@@ -3,27 +3,84 @@ Target Validation Module
 Validates targets before scanning to ensure they're in scope
 """
 
+import bisect
 import socket
 import ipaddress
 import re
-from typing import Tuple, Optional, List
+import time
+from typing import Dict, Tuple, Optional, List
 from rich.console import Console
 import subprocess
-import shutil
+import sys
 
 console = Console()
 
+# Platform detection and the matching ping flags, computed once at import
+# instead of shelling out per reachability check
+_IS_WINDOWS = sys.platform.startswith('win')
+_PING_COUNT_FLAG = '-n' if _IS_WINDOWS else '-c'
+_PING_TIMEOUT_FLAG = '-w' if _IS_WINDOWS else '-W'
+
+# Compiled once; validation calls just run the match
+_HOSTNAME_RE = re.compile(
+    r'^(?=.{1,253}$)'  # Total length check
+    r'(?!-)'  # Cannot start with hyphen
+    r'[a-zA-Z0-9-]{1,63}'  # First label
+    r'(?<!-)'  # Cannot end with hyphen
+    r'(\.[a-zA-Z0-9-]{1,63}(?<!-))*$'  # Additional labels
+)
+
+# Characters that can appear in IPv4/IPv6 CIDR notation; anything else is
+# rejected up front instead of through ip_network's ValueError
+_CIDR_CHARS_RE = re.compile(r'^[0-9a-fA-F.:/]+$')
+
+# How long resolved addresses stay cached, in seconds
+_DNS_TTL = 60.0
+
+# RFC1918 + loopback ranges, built once at import. Validation itself relies
+# on ip_address.is_private; this exists for callers that need the networks.
+_PRIVATE_RANGES = (
+    ipaddress.ip_network('10.0.0.0/8'),
+    ipaddress.ip_network('172.16.0.0/12'),
+    ipaddress.ip_network('192.168.0.0/16'),
+    ipaddress.ip_network('127.0.0.0/8'),  # Localhost
+)
+
+# Common AWS public ranges kept as sorted integer intervals, so membership
+# is a bisect into a flat array rather than per-prefix string compares.
+# Extending this to a full provider ip-ranges dump stays O(log N).
+_CLOUD_NETWORKS = ('3.0.0.0/8', '13.0.0.0/8', '18.0.0.0/8', '52.0.0.0/8', '54.0.0.0/8')
+_CLOUD_INTERVALS = sorted(
+    (int(net.network_address), int(net.broadcast_address))
+    for net in map(ipaddress.ip_network, _CLOUD_NETWORKS)
+)
+_CLOUD_STARTS = [start for start, _ in _CLOUD_INTERVALS]
+
+def _in_cloud_range(ip: ipaddress.IPv4Address) -> bool:
+    """Whether an IPv4 address falls inside a known cloud-provider range"""
+    ip_int = int(ip)
+    idx = bisect.bisect_right(_CLOUD_STARTS, ip_int) - 1
+    return idx >= 0 and ip_int <= _CLOUD_INTERVALS[idx][1]
+
 class TargetValidator:
     """Validate scanning targets"""
     
     def __init__(self):
-        self.private_ranges = [
-            ipaddress.ip_network('10.0.0.0/8'),
-            ipaddress.ip_network('172.16.0.0/12'),
-            ipaddress.ip_network('192.168.0.0/16'),
-            ipaddress.ip_network('127.0.0.0/8'),  # Localhost
-        ]
-    
+        # hostname -> (monotonic timestamp, resolved IP); repeated lookups
+        # of the same host skip the resolver round trip for _DNS_TTL seconds
+        self._dns_cache: Dict[str, Tuple[float, str]] = {}
+
+    def _resolve(self, hostname: str) -> str:
+        """Resolve a hostname to an IP, caching results briefly"""
+        now = time.monotonic()
+        cached = self._dns_cache.get(hostname)
+        if cached is not None and now - cached[0] < _DNS_TTL:
+            return cached[1]
+
+        ip_address = socket.gethostbyname(hostname)
+        self._dns_cache[hostname] = (now, ip_address)
+        return ip_address
+
     def validate_target(self, target: str, allow_private: bool = True) -> Tuple[bool, str, Dict]:
         """
         Validate a target before scanning
@@ -67,7 +124,7 @@ class TargetValidator:
             
             # Try to resolve DNS
             try:
-                ip_address = socket.gethostbyname(target)
+                ip_address = self._resolve(target)
                 details["dns_resolved"] = True
                 details["ip_address"] = ip_address
                 
@@ -96,26 +153,31 @@ class TargetValidator:
         # Remove trailing dot if present
         if hostname.endswith('.'):
             hostname = hostname[:-1]
-        
-        # Hostname regex pattern
-        pattern = re.compile(
-            r'^(?=.{1,253}$)'  # Total length check
-            r'(?!-)'  # Cannot start with hyphen
-            r'[a-zA-Z0-9-]{1,63}'  # First label
-            r'(?<!-)'  # Cannot end with hyphen
-            r'(\.[a-zA-Z0-9-]{1,63}(?<!-))*$'  # Additional labels
-        )
-        
-        return bool(pattern.match(hostname))
+
+        return bool(_HOSTNAME_RE.match(hostname))
     
     def _check_reachable(self, target: str, timeout: int = 2) -> bool:
-        """Check if target is reachable via ping"""
-        param = '-n' if shutil.which('ping') and 'Windows' in str(subprocess.check_output(['ver'], shell=True)) else '-c'
-        
+        """Check if target is reachable via a TCP probe, falling back to ping"""
+        # A direct connect is a single syscall instead of the fork+exec of a
+        # ping child; a refused connection still proves the host is up
+        for port in (80, 443):
+            try:
+                with socket.create_connection((target, port), timeout=timeout):
+                    return True
+            except ConnectionRefusedError:
+                return True
+            except OSError:
+                continue
+
+        return self._ping(target, timeout)
+
+    def _ping(self, target: str, timeout: int) -> bool:
+        """Fallback reachability probe for hosts with both web ports filtered"""
         try:
             # Use ping to check if host is reachable
             result = subprocess.run(
-                ['ping', param, '1', '-w' if param == '-n' else '-W', str(timeout * 1000 if param == '-n' else timeout), target],
+                ['ping', _PING_COUNT_FLAG, '1', _PING_TIMEOUT_FLAG,
+                 str(timeout * 1000 if _IS_WINDOWS else timeout), target],
                 capture_output=True,
                 timeout=timeout + 1
             )
@@ -130,10 +192,15 @@ class TargetValidator:
         Returns:
             Tuple[bool, str, Optional[IPv4Network]]: (is_valid, message, network_object)
         """
+        # Cheap branch rejection for obvious non-CIDR input; raising and
+        # catching ValueError per bad entry is costly in batch validation
+        if not network or not _CIDR_CHARS_RE.match(network):
+            return False, f"Invalid network range: {network!r} is not CIDR notation", None
+
         try:
             net = ipaddress.ip_network(network, strict=False)
-            
-            # Warn about large networks
+
+            # Property access recomputes, so read it once
             num_hosts = net.num_addresses
             if num_hosts > 1024:
                 message = f"Warning: Network {network} contains {num_hosts} addresses. This may take a long time to scan."
@@ -189,24 +256,23 @@ class TargetValidator:
         if target.lower() in localhost_variants:
             issues.append("Warning: Target is localhost. You're scanning your own machine.")
         
-        # Check for common cloud provider IPs (should get explicit confirmation)
-        if target.startswith(('3.', '13.', '18.', '52.', '54.')):
-            issues.append("Warning: Target appears to be an AWS IP. Ensure you have proper authorization.")
-        
-        # Check for common internal/infrastructure IPs
         try:
             ip = ipaddress.ip_address(target)
-            if str(ip).endswith('.1'):
-                issues.append("Info: Target ends in .1, likely a gateway/router.")
-            if str(ip).endswith('.254'):
-                issues.append("Info: Target ends in .254, commonly used for routers.")
         except ValueError:
-            pass
-        
-        return issues
+            return issues
+
+        # Check for common cloud provider IPs (should get explicit confirmation)
+        if ip.version == 4 and _in_cloud_range(ip):
+            issues.append("Warning: Target appears to be an AWS IP. Ensure you have proper authorization.")
+
+        # Check for common internal/infrastructure IPs
+        if str(ip).endswith('.1'):
+            issues.append("Info: Target ends in .1, likely a gateway/router.")
+        if str(ip).endswith('.254'):
+            issues.append("Info: Target ends in .254, commonly used for routers.")
 
+        return issues
 
-from typing import Dict
 
 def display_validation_result(is_valid: bool, message: str, details: Dict):
     """Display validation results in a nice format"""
@@ -11,6 +11,7 @@ setup(
         'python-dotenv>=1.0.0',
         'rich>=13.0.0',
         'pydantic>=2.0.0',
+        'prompt_toolkit>=3.0.0',
     ],
     entry_points={
         'console_scripts': [
@@ -30,11 +31,10 @@ setup(
         "Intended Audience :: System Administrators",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
         "Topic :: Security",
         "Topic :: System :: Systems Administration",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
 )